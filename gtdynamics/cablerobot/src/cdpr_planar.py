@@ -15,6 +15,10 @@ import gtsam
 import numpy as np
 from gtsam import Pose3, Rot3
 
+# Rows of a Pose3/twist tangent vector that move out of the xz plane.
+_OUT_OF_PLANE_ROWS = np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
+                               [0, 0, 0, 0, 1, 0.]])
+
 
 class CdprParams:
     """Parameters relevant to cable robot geometry and properties
@@ -106,42 +110,41 @@ class Cdpr:
             gtsam.NonlinearFactorGraph: The factors for kinematics
         """
         kfg = gtsam.NonlinearFactorGraph()
+        lid = self.ee_id()
         for k in ks:
+            pose_key = gtd.PoseKey(lid, k).key()
+            twist_key = gtd.TwistKey(lid, k).key()
             for ji in range(4):
                 kfg.push_back(
                     gtd.CableLengthFactor(
                         gtd.JointAngleKey(ji, k).key(),
-                        gtd.PoseKey(self.ee_id(), k).key(),  #
+                        pose_key,  #
                         self.costmodel_l,
                         self.params.a_locs[ji],
                         self.params.b_locs[ji]))
                 kfg.push_back(
                     gtd.CableVelocityFactor(
                         gtd.JointVelKey(ji, k).key(),
-                        gtd.PoseKey(self.ee_id(), k).key(),
-                        gtd.TwistKey(self.ee_id(), k).key(),  #
+                        pose_key,
+                        twist_key,  #
                         self.costmodel_ldot,
                         self.params.a_locs[ji],
                         self.params.b_locs[ji]))
             # constrain out-of-plane movements
             zeroT = gtsam.Values()
-            gtd.InsertPose(zeroT, self.ee_id(), k, Pose3())
+            gtd.InsertPose(zeroT, lid, k, Pose3())
             kfg.push_back(
                 gtsam.LinearContainerFactor(
-                    gtsam.JacobianFactor(
-                        gtd.PoseKey(self.ee_id(), k).key(),
-                        np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
-                                  [0, 0, 0, 0, 1, 0.]]), np.zeros(3),
-                        self.costmodel_planar_pose), zeroT))
+                    gtsam.JacobianFactor(pose_key, _OUT_OF_PLANE_ROWS,
+                                         np.zeros(3),
+                                         self.costmodel_planar_pose), zeroT))
             zeroV = gtsam.Values()
-            gtd.InsertTwist(zeroV, self.ee_id(), k, np.zeros(6))
+            gtd.InsertTwist(zeroV, lid, k, np.zeros(6))
             kfg.push_back(
                 gtsam.LinearContainerFactor(
-                    gtsam.JacobianFactor(
-                        gtd.TwistKey(self.ee_id(), k).key(),
-                        np.array([[1, 0, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0],
-                                  [0, 0, 0, 0, 1, 0.]]), np.zeros(3),
-                        self.costmodel_planar_twist), zeroV))
+                    gtsam.JacobianFactor(twist_key, _OUT_OF_PLANE_ROWS,
+                                         np.zeros(3),
+                                         self.costmodel_planar_twist), zeroV))
         return kfg
 
     def dynamics_factors(self, ks=[]):
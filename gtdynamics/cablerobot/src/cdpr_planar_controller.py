@@ -44,7 +44,14 @@ class CdprController(CdprControllerBase):
     """Precomputes the open-loop trajectory
     then just calls on that for each update.
     """
-    def __init__(self, cdpr, x0, pdes=[], dt=0.01, Q=None, R=np.array([1.])):
+    def __init__(self,
+                 cdpr,
+                 x0,
+                 pdes=[],
+                 dt=0.01,
+                 Q=None,
+                 R=np.array([1.]),
+                 dynamics_fg=None):
         """constructor
 
         Args:
@@ -55,17 +62,22 @@ class CdprController(CdprControllerBase):
             Q (np.ndarray, optional): State objective cost (as a vector). Defaults to None, which
             denotes a constrained noise model.
             R (np.ndarray, optional): Control cost (as a 1-vector). Defaults to np.array([1.]).
+            dynamics_fg (gtsam.NonlinearFactorGraph, optional): Prebuilt
+            `cdpr.all_factors(len(pdes), dt)`, which can be shared by controllers with the same
+            horizon and dt that only differ in their objectives. Defaults to None, which builds it.
         """
         self.cdpr = cdpr
         self.pdes = pdes
         self.dt = dt
 
         # create iLQR graph
-        fg = self.create_ilqr_fg(cdpr, x0, pdes, dt, Q, R)
-        # initial guess
-        init = utils.zerovalues(cdpr.ee_id(), range(len(pdes)), dt=dt)
-        # optimize
-        self.optimizer = gtsam.LevenbergMarquardtOptimizer(fg, init)
+        fg = self.create_ilqr_fg(cdpr, x0, pdes, dt, Q, R, dynamics_fg)
+        # initial guess, warm-started along the desired trajectory
+        init = utils.collocatedvalues(cdpr.ee_id(), pdes, dt=dt)
+        # optimize, eliminating the banded trajectory graph in time order
+        params = gtsam.LevenbergMarquardtParams()
+        params.setOrdering(utils.time_ordering(init))
+        self.optimizer = gtsam.LevenbergMarquardtOptimizer(fg, init, params)
         self.result = self.optimizer.optimize()
         self.fg = fg
 
@@ -76,7 +88,7 @@ class CdprController(CdprControllerBase):
         return self.result
 
     @staticmethod
-    def create_ilqr_fg(cdpr, x0, pdes, dt, Q, R):
+    def create_ilqr_fg(cdpr, x0, pdes, dt, Q, R, dynamics_fg=None):
         """Creates the factor graph for the iLQR problem.  This essentially consists of creating a
         factor graph that describes the CDPR dynamics over all time steps, then adding state
         objective and control cost factors.
@@ -88,29 +100,48 @@ class CdprController(CdprControllerBase):
             dt (float): time step duration
             Q (Union[np.ndarray, None]): The state objective cost (None for hard constraint)
             R (np.ndarray): The control cost
+            dynamics_fg (gtsam.NonlinearFactorGraph, optional): Prebuilt dynamics factors for all
+            time steps. Defaults to None, which builds them with `cdpr.all_factors`.
+
+        Raises:
+            ValueError: if dynamics_fg does not span exactly len(pdes) time steps of duration dt
 
         Returns:
             gtsam.NonlinearFactorGraph: The factor graph corresponding to the iLQR problem.
         """
         N = len(pdes)
+        lid = cdpr.ee_id()
+        if dynamics_fg is not None:
+            keys = dynamics_fg.keys()
+            if not keys.exists(gtd.PoseKey(lid, N - 1).key()) or \
+                    keys.exists(gtd.PoseKey(lid, N).key()):
+                raise ValueError(
+                    "dynamics_fg does not span the {:d} time steps of pdes".format(N))
+            # the dt prior (key 0) is built into the graph, so it must agree with dt
+            dt_values = gtsam.Values()
+            dt_values.insert(0, dt)
+            for i in range(dynamics_fg.size()):
+                factor = dynamics_fg.at(i)
+                if list(factor.keys()) == [0] and factor.error(dt_values) > 1e-9:
+                    raise ValueError("dynamics_fg was built for a different dt than {}".format(dt))
         # initial conditions
         fg = cdpr.priors_ik(ks=[0],
-                            Ts=[gtd.Pose(x0, cdpr.ee_id(), 0)],
-                            Vs=[gtd.Twist(x0, cdpr.ee_id(), 0)])
+                            Ts=[gtd.Pose(x0, lid, 0)],
+                            Vs=[gtd.Twist(x0, lid, 0)])
         # dynamics
-        fg.push_back(cdpr.all_factors(N, dt))
-        # control costs
+        if dynamics_fg is None:
+            dynamics_fg = cdpr.all_factors(N, dt)
+        fg.push_back(dynamics_fg)
+        # control costs, all sharing one noise model
+        cost_u = gtsam.noiseModel.Diagonal.Precisions(R)
         for k in range(N):
             for ji in range(4):
                 fg.push_back(
-                    gtd.PriorFactorDouble(
-                        gtd.TorqueKey(ji, k).key(), 0.0,
-                        gtsam.noiseModel.Diagonal.Precisions(R)))
+                    gtd.PriorFactorDouble(gtd.TorqueKey(ji, k).key(), 0.0, cost_u))
         # state objective costs
         cost_x = gtsam.noiseModel.Isotropic.Sigma(6, 0.001) if Q is None else \
             gtsam.noiseModel.Diagonal.Precisions(Q)
         for k in range(N):
             fg.push_back(
-                gtsam.PriorFactorPose3(
-                    gtd.PoseKey(cdpr.ee_id(), k).key(), pdes[k], cost_x))
+                gtsam.PriorFactorPose3(gtd.PoseKey(lid, k).key(), pdes[k], cost_x))
         return fg
@@ -50,5 +50,32 @@ class TestCdprPlanar(GtsamTestCase):
         for k, (des, act) in enumerate(zip(x_des, pAct)):
             self.gtsamAssertEquals(des, act, tol=1e-2)
 
+    def testSharedDynamicsGraph(self):
+        """Tests controllers sharing a prebuilt dynamics graph match ones that build their own
+        """
+        cdpr = Cdpr()
+
+        x0 = gtsam.Values()
+        gtd.InsertPose(x0, cdpr.ee_id(), 0, Pose3(Rot3(), (1.5, 0, 1.5)))
+        gtd.InsertTwist(x0, cdpr.ee_id(), 0, np.zeros(6))
+
+        x_des = [Pose3(Rot3(), (1.5+k/20.0, 0, 1.5)) for k in range(5)]
+        dynamics_fg = cdpr.all_factors(len(x_des), 0.1)
+        for R in [np.array([1.]), np.array([1e-2])]:
+            shared = CdprController(cdpr, x0=x0, pdes=x_des, dt=0.1, R=R,
+                                    dynamics_fg=dynamics_fg)
+            fresh = CdprController(cdpr, x0=x0, pdes=x_des, dt=0.1, R=R)
+            self.gtsamAssertEquals(shared.result, fresh.result)
+
+        # the prebuilt graph must have the same horizon and dt as the controller
+        with self.assertRaises(ValueError):
+            CdprController(cdpr, x0=x0, pdes=x_des[:-1], dt=0.1, dynamics_fg=dynamics_fg)
+        with self.assertRaises(ValueError):
+            CdprController(cdpr, x0=x0, pdes=x_des + x_des[-1:], dt=0.1,
+                           dynamics_fg=dynamics_fg)
+        with self.assertRaises(ValueError):
+            CdprController(cdpr, x0=x0, pdes=x_des, dt=0.01, dynamics_fg=dynamics_fg)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,69 @@
+"""
+GTDynamics Copyright 2021, Georgia Tech Research Corporation,
+Atlanta, Georgia 30332-0415
+All Rights Reserved
+See LICENSE for the license information
+
+@file  test_utils.py
+@brief Unit tests for cable robot utilities.
+@author Frank Dellaert
+@author Gerry Chen
+"""
+
+import unittest
+
+import gtdynamics as gtd
+import gtsam
+import numpy as np
+from gtsam import Pose3, Rot3
+from gtsam.utils.test_case import GtsamTestCase
+
+import utils
+from cdpr_planar import Cdpr
+
+
+class TestUtils(GtsamTestCase):
+    """Unit tests for cable robot utilities"""
+    def setUp(self):
+        self.cdpr = Cdpr()
+        self.lid = self.cdpr.ee_id()
+        self.dt = 0.1
+
+    def check_collocatedvalues(self, pdes):
+        """Checks the initial values follow pdes and satisfy the collocation factors."""
+        N = len(pdes)
+        init = utils.collocatedvalues(self.lid, pdes, dt=self.dt)
+        for k, pose in enumerate(pdes):
+            self.gtsamAssertEquals(gtd.Pose(init, self.lid, k), pose)
+        fg = self.cdpr.collocation_factors(ks=range(N - 1), dt=self.dt)
+        self.assertAlmostEqual(fg.error(init), 0)
+
+    def testCollocatedValues(self):
+        """Tests collocatedvalues along a curved trajectory"""
+        pdes = [Pose3(Rot3.Ry(0.1 * k), (1.5 + k / 20.0, 0, 1.5 + k * k / 100.0))
+                for k in range(5)]
+        self.check_collocatedvalues(pdes)
+
+    def testCollocatedValuesEdgeCases(self):
+        """Tests collocatedvalues with no poses or a single pose"""
+        self.check_collocatedvalues([])
+        self.check_collocatedvalues([Pose3(Rot3(), (1.5, 0, 1.5))])
+        init = utils.collocatedvalues(self.lid, [], dt=self.dt)
+        self.assertEqual(init.size(), 1)
+        self.assertEqual(init.atDouble(0), self.dt)
+
+    def testTimeOrdering(self):
+        """Tests time_ordering eliminates time steps in order, with dt last"""
+        pdes = [Pose3(Rot3(), (1.5 + k / 20.0, 0, 1.5)) for k in range(4)]
+        init = utils.collocatedvalues(self.lid, pdes, dt=self.dt)
+        ordering = utils.time_ordering(init)
+        self.assertEqual(ordering.size(), init.size())
+        self.assertEqual(ordering.at(ordering.size() - 1), 0)
+        times = [gtd.DynamicsSymbol(ordering.at(i)).time()
+                 for i in range(ordering.size() - 1)]
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(set(times), set(range(len(pdes))))
+
+
+if __name__ == "__main__":
+    unittest.main()
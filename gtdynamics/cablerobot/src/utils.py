@@ -37,3 +37,55 @@ def zerovalues(lid, ts=[], dt=0.01):
         gtd.InsertTwist(zero, lid, t, np.zeros(6))
         gtd.InsertTwistAccel(zero, lid, t, np.zeros(6))
     return zero
+
+def collocatedvalues(lid, Ts=[], dt=0.01):
+    """Creates a values object for initialization along a trajectory of (end-effector) poses.  The
+    twists and twist accelerations are chosen to exactly satisfy the Euler collocation factors
+    between consecutive time steps, and the remaining variables are populated with zeros.
+
+    Args:
+        lid (int): The id of the (end-effector) link
+        Ts (List[gtsam.Pose3], optional): Poses at time steps 0, 1, ... Defaults to [].
+        dt (float, optional): Time step duration. Defaults to 0.01.
+
+    Returns:
+        gtsam.Values: initialized values
+    """
+    # pose(k+1) = pose(k) * Expmap(twist(k) * dt), and likewise for the twist
+    Vs = [gtsam.Pose3.Logmap(T0.between(T1)) / dt for T0, T1 in zip(Ts[:-1], Ts[1:])]
+    Vs.append(Vs[-1] if Vs else np.zeros(6))
+    VAs = [(V1 - V0) / dt for V0, V1 in zip(Vs[:-1], Vs[1:])]
+    VAs.append(np.zeros(6))
+
+    init = gtsam.Values()
+    init.insert(0, dt)
+    for t, (T, V, VA) in enumerate(zip(Ts, Vs, VAs)):
+        for j in range(4):
+            gtd.InsertJointAngle(init, j, t, 0)
+            gtd.InsertJointVel(init, j, t, 0)
+            gtd.InsertTorque(init, j, t, 0)
+            gtd.InsertWrench(init, lid, j, t, np.zeros(6))
+        gtd.InsertPose(init, lid, t, T)
+        gtd.InsertTwist(init, lid, t, V)
+        gtd.InsertTwistAccel(init, lid, t, VA)
+    return init
+
+def time_ordering(values, last_keys=(0,)):
+    """Creates an elimination ordering that eliminates one time step at a time.  Trajectory factor
+    graphs only connect adjacent time steps, so this keeps the fill-in of the Cholesky
+    factorization within the block-band.
+
+    Args:
+        values (gtsam.Values): values containing all the variables to eliminate
+        last_keys (tuple, optional): keys shared by all time steps, which are eliminated last.
+        Defaults to (0,), the time step duration.
+
+    Returns:
+        gtsam.Ordering: the elimination ordering
+    """
+    keys = [key for key in values.keys() if key not in last_keys]
+    keys.sort(key=lambda key: gtd.DynamicsSymbol(key).time())
+    ordering = gtsam.Ordering()
+    for key in keys + list(last_keys):
+        ordering.push_back(key)
+    return ordering
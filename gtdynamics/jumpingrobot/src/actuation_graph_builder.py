@@ -135,10 +135,13 @@ class ActuationGraphBuilder:
             graph.add(self.actuator_dynamics_graph(jr, actuator, k))
         return graph
 
-    def collocation_graph(self, jr: JumpingRobot,
-                          step_phases: list) -> NonlinearFactorGraph:
-        """ Create a factor graph containing collocation constraints on actuation variables. """
-        collocation = gtd.CollocationScheme.Trapezoidal
+    def collocation_graph(self, jr: JumpingRobot, step_phases: list,
+                          collocation=gtd.CollocationScheme.Trapezoidal
+                          ) -> NonlinearFactorGraph:
+        """ Create a factor graph containing collocation constraints on actuation variables.
+            Any scheme other than Euler is treated as Trapezoidal.
+        """
+        is_euler = collocation == gtd.CollocationScheme.Euler
         graph = NonlinearFactorGraph()
         for time_step in range(len(step_phases)):
             phase = step_phases[time_step]
@@ -166,6 +169,6 @@ class ActuationGraphBuilder:
             m_s_curr_key = Actuator.SourceMassKey(k_curr)
             gtd.AddSourceMassCollocationFactor(graph, mdot_prev_keys,
                                                mdot_curr_keys, m_s_prev_key,
-                                               m_s_curr_key, dt_key, False,
+                                               m_s_curr_key, dt_key, is_euler,
                                                self.m_col_cost_model)
         return graph
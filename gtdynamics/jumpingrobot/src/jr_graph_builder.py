@@ -38,10 +38,18 @@ class JRGraphBuilder:
         self.robot_graph_builder = RobotGraphBuilder()
         self.actuation_graph_builder = ActuationGraphBuilder()
 
-    def collocation_graph(self, jr: JumpingRobot, step_phases: list):
-        """ Create a factor graph containing collocation constraints. """
-        graph = self.actuation_graph_builder.collocation_graph(jr, step_phases)
-        graph.push_back(self.robot_graph_builder.collocation_graph(jr, step_phases))
+    def collocation_graph(self, jr: JumpingRobot, step_phases: list,
+                          collocation=gtd.CollocationScheme.Trapezoidal):
+        """ Create a factor graph containing collocation constraints.
+            Only Euler and Trapezoidal collocation schemes are supported.
+        """
+        if collocation not in [gtd.CollocationScheme.Euler,
+                               gtd.CollocationScheme.Trapezoidal]:
+            raise Exception("collocation scheme not supported yet")
+        graph = self.actuation_graph_builder.collocation_graph(
+            jr, step_phases, collocation)
+        graph.push_back(self.robot_graph_builder.collocation_graph(
+            jr, step_phases, collocation))
 
         # add collocation factors for time
         for time_step in range(len(step_phases)):
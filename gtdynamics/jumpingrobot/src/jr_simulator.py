@@ -140,7 +140,7 @@ class JRSimulator:
         robot_graph_builder = self.jr_graph_builder.robot_graph_builder
         opt = robot_graph_builder.graph_builder.opt()
         torso_i = self.jr.robot.link("torso").id()
-        link_names = [link.name() for link in self.jr.robot.links()]
+        link_names = {link.name() for link in self.jr.robot.links()}
 
         # solve q level
         graph_q = robot_graph_builder.graph_builder.qFactors(
@@ -209,13 +209,13 @@ class JRSimulator:
                 gtd.PriorFactorDouble(torque_key,
                                       init_values.atDouble(torque_key),
                                       opt.prior_t_cost_model))
+        # priors only add factors on existing keys, so the key set is fixed
+        graph_dynamics_keys = set(
+            gtd.KeySetToKeyVector(graph_dynamics.keys()))
         for link in self.jr.robot.links():
             i = link.id()
             pose_key = gtd.PoseKey(i, k).key()
             twist_key = gtd.TwistKey(i, k).key()
-            graph_dynamics_keys = [
-                key for key in gtd.KeySetToKeyVector(graph_dynamics.keys())
-            ]
             if pose_key in graph_dynamics_keys:
                 graph_dynamics.add(
                     gtsam.PriorFactorPose3(pose_key,
@@ -248,8 +248,8 @@ class JRSimulator:
             Exception: optimization does not converge
         """
 
-        link_names = [link.name() for link in self.jr.robot.links()]
-        joint_names = [joint.name() for joint in self.jr.robot.joints()]
+        link_names = {link.name() for link in self.jr.robot.links()}
+        joint_names = {joint.name() for joint in self.jr.robot.joints()}
 
         # construct dynamcis graph for the time step
         robot_graph_builder = self.jr_graph_builder.robot_graph_builder
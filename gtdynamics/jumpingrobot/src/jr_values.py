@@ -269,7 +269,7 @@ class JRValues:
         """
 
         # perform forward kinematics
-        link_names = [link.name() for link in jr.robot.links()]
+        link_names = {link.name() for link in jr.robot.links()}
         if "ground" not in link_names:
             fk_results = jr.robot.forwardKinematics(values, k, "torso")
         else:
@@ -366,6 +366,9 @@ class JRValues:
         j = jr.robot.joint("foot_" + side).id()
         wrench_b = gtd.Wrench(values, i, j, k)
         T_wb = gtd.Pose(values, i, k)
-        wrench_w = T_wb.inverse().AdjointMap().transpose().dot(wrench_b)
-        print(side + " force: ", wrench_w[5])
-        return wrench_w[5]
+        # the force part of Ad(T_bw)^T * wrench_b is just R_wb * force_b, so
+        # rotate the force directly instead of forming the 6x6 adjoint
+        R_wb = T_wb.rotation().matrix()
+        force_z = R_wb[2].dot(wrench_b[3:])
+        print(side + " force: ", force_z)
+        return force_z
@@ -27,18 +27,15 @@ from matplotlib.animation import FuncAnimation
 from jumping_robot import Actuator, JumpingRobot
 
 
-def update_jr_frame(ax, values, jr, k):
-    """ Update the jr animation frame. """
-    link_names = ["shank_r", "thigh_r", "torso", "thigh_l", "shank_l"]
-    colors = ["red", "orange", "black", "green", "blue"]
+LINK_NAMES = ["shank_r", "thigh_r", "torso", "thigh_l", "shank_l"]
+LINK_COLORS = ["red", "orange", "black", "green", "blue"]
 
-    ax.clear()
 
-    for name, color in zip(link_names, colors):
-        link = jr.robot.link(name)
-        i = link.id()
-        pose = gtd.Pose(values, i, k)
+def draw_jr_frame(ax, poses):
+    """ Draw the jr links with the given poses, in the order of LINK_NAMES. """
+    ax.clear()
 
+    for pose, color in zip(poses, LINK_COLORS):
         y = pose.y()
         z = pose.z()
         theta = pose.rotation().roll()
@@ -50,26 +47,17 @@ def update_jr_frame(ax, values, jr, k):
 
         ax.plot([start_y, end_y], [start_z, end_z], color=color)
 
-    # for link in jr.robot.links():
-    #     i = link.id()
-    #     pose = link.bMcom()
-
-    #     y = pose.y()
-    #     z = pose.z()
-    #     theta = pose.rotation().roll()
-    #     l = 0.55
-    #     start_y = y - l/2 * np.cos(theta)
-    #     start_z = z - l/2 * np.sin(theta)
-    #     end_y = y + l/2 * np.cos(theta)
-    #     end_z = z + l/2 * np.sin(theta)
-
-    #     ax.plot([start_y, end_y], [start_z, end_z], color='k', alpha=0.2)
-
     ax.set_aspect('equal', adjustable='box')
     ax.set_xlim(-1, 1)
     ax.set_ylim(-1, 2)
 
 
+def update_jr_frame(ax, values, jr, k):
+    """ Update the jr animation frame. """
+    link_ids = [jr.robot.link(name).id() for name in LINK_NAMES]
+    draw_jr_frame(ax, [gtd.Pose(values, i, k) for i in link_ids])
+
+
 def visualize_jr(values: gtsam.Values, jr: JumpingRobot, k: int):
     """ Visualize the jumping robot.
 
@@ -90,9 +78,14 @@ def visualize_jr_trajectory(values, jr, num_steps, step=1):
     fig = plt.figure(figsize=(10, 10), dpi=80)
     ax = fig.add_subplot(1, 1, 1)
 
-    def animate(i):
-        update_jr_frame(ax, values, jr, i)
+    # resolve link ids and pose keys once, and extract all poses up front
+    link_ids = [jr.robot.link(name).id() for name in LINK_NAMES]
     frames = np.arange(0, num_steps, step)
+    poses = {k: [values.atPose3(gtd.PoseKey(i, k).key()) for i in link_ids]
+             for k in frames}
+
+    def animate(k):
+        draw_jr_frame(ax, poses[k])
     FuncAnimation(fig, animate, frames=frames, interval=10)
     plt.show()
 
@@ -118,9 +111,11 @@ def make_plot(values, jr, num_steps):
     masses_dict["source"] = []
     time_list = []
 
+    # look up joint ids once instead of at every step
+    joint_ids = {name: jr.robot.joint(name).id() for name in joint_names}
+
     for k in range(num_steps):
-        for name in joint_names:
-            j = jr.robot.joint(name).id()
+        for name, j in joint_ids.items():
             qs_dict[name].append(gtd.JointAngle(values, j, k))
             vs_dict[name].append(gtd.JointVel(values, j, k))
             torques_dict[name].append(gtd.Torque(values, j, k))
@@ -10,6 +10,10 @@
 """
 
 
+import copy
+import os.path as osp
+from functools import lru_cache
+
 import yaml
 import numpy as np
 import gtsam
@@ -17,6 +21,9 @@ from gtsam import Pose2, Pose3, Point3, Rot3, Values
 from gtsam import NonlinearFactorGraph, RangeFactorPose2, PriorFactorPose2
 import gtdynamics as gtd
 
+# Shared identity rotation for the axis-aligned joint and link frames.
+_IDENTITY_ROT = Rot3()
+
 
 class Actuator:
     """ Class that stores all parameters for an actuator. """
@@ -110,9 +117,17 @@ class JumpingRobot:
     @staticmethod
     def load_file(yaml_file_path: str):
         """ Load jumping robot params from yaml file. """
+        # a robot is created for every phase change, so only re-parse the
+        # file when it is modified, and hand out a copy of the cached params
+        mtime = osp.getmtime(yaml_file_path)
+        return copy.deepcopy(JumpingRobot._parse_file(yaml_file_path, mtime))
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _parse_file(yaml_file_path: str, mtime: float):
+        """ Parse the yaml file, memoized on its path and modification time. """
         with open(yaml_file_path) as file:
-            params = yaml.safe_load(file)
-            return params
+            return yaml.safe_load(file)
 
     @staticmethod
     def create_init_config(torso_pose=gtsam.Pose3(gtsam.Rot3(), gtsam.Point3(0, 0, 1.1)),
@@ -254,6 +269,16 @@ class JumpingRobot:
         Returns:
             dict, dict: link poses, joint poses
         """
+        # the poses only depend on the morphology, which is the same for every
+        # phase, so reuse them instead of re-solving for each new robot
+        link_poses, joint_poses = JumpingRobot._compute_poses_cached(
+            tuple(length_list), foot_distance)
+        return dict(link_poses), dict(joint_poses)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _compute_poses_cached(length_list: tuple, foot_distance: float):
+        """ Memoized version of compute_poses, takes length_list as a tuple. """
 
         # compute the configuration of the robot by solving a small optimization problem
         values = JumpingRobot.compute_poses_helper(length_list, foot_distance)
@@ -275,12 +300,12 @@ class JumpingRobot:
         link_poses["shank_l"] = Pose3(rot_l, Point3(0, p3.x(), p3.y()))
 
         joint_poses = {}
-        joint_poses["foot_r"] = Pose3(Rot3(), Point3(0, p0.x(), p0.y()))
-        joint_poses["knee_r"] = Pose3(Rot3(), Point3(0, (p0.x() + p1.x())/2, (p0.y() + p1.y())/2))
-        joint_poses["hip_r"] = Pose3(Rot3(), Point3(0, p1.x(), p1.y()))
-        joint_poses["hip_l"] = Pose3(Rot3(), Point3(0, p2.x(), p2.y()))
-        joint_poses["knee_l"] = Pose3(Rot3(), Point3(0, (p2.x() + p3.x())/2, (p2.y()+p3.y())/2))
-        joint_poses["foot_l"] = Pose3(Rot3(), Point3(0, p3.x(), p3.y()))
+        joint_poses["foot_r"] = Pose3(_IDENTITY_ROT, Point3(0, p0.x(), p0.y()))
+        joint_poses["knee_r"] = Pose3(_IDENTITY_ROT, Point3(0, (p0.x() + p1.x())/2, (p0.y() + p1.y())/2))
+        joint_poses["hip_r"] = Pose3(_IDENTITY_ROT, Point3(0, p1.x(), p1.y()))
+        joint_poses["hip_l"] = Pose3(_IDENTITY_ROT, Point3(0, p2.x(), p2.y()))
+        joint_poses["knee_l"] = Pose3(_IDENTITY_ROT, Point3(0, (p2.x() + p3.x())/2, (p2.y()+p3.y())/2))
+        joint_poses["foot_l"] = Pose3(_IDENTITY_ROT, Point3(0, p3.x(), p3.y()))
         return link_poses, joint_poses
 
     @staticmethod
@@ -317,7 +342,7 @@ class JumpingRobot:
     @staticmethod
     def construct_link(link_id: int, link_name: str, mass: float, length: float, radius: float, pose: Pose3):
         """ Construct a link. """
-        lTcom = Pose3(Rot3(), Point3(0, length/2, 0))
+        lTcom = Pose3(_IDENTITY_ROT, Point3(0, length/2, 0))
         bMcom = pose.compose(lTcom)
         inertia = JumpingRobot.compute_link_inertia(mass, length, radius)
         return gtd.Link(link_id, link_name, mass, inertia, bMcom, pose, False)
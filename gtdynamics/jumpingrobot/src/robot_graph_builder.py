@@ -69,7 +69,7 @@ class RobotGraphBuilder:
     def dynamics_graph(self, jr: JumpingRobot, k: int) -> NonlinearFactorGraph:
         """ Create a factor graph of dynamcis constraints for robot frame. """
         graph = self.graph_builder.dynamicsFactorGraph(jr.robot, k, None, None)
-        joint_names = [joint.name() for joint in jr.robot.joints()]
+        joint_names = {joint.name() for joint in jr.robot.joints()}
         for name in ["foot_l", "foot_r"]:
             if name in joint_names:
                 j = jr.robot.joint(name).id()
@@ -80,16 +80,17 @@ class RobotGraphBuilder:
                         self.graph_builder.opt().t_cost_model))
         return graph
 
-    def collocation_graph(self, jr: JumpingRobot, step_phases: list):
+    def collocation_graph(self, jr: JumpingRobot, step_phases: list,
+                          collocation=gtd.CollocationScheme.Trapezoidal):
         """ Create a factor graph containing collocation constraints.
             - For ground phase, only collocation on the torso link, which is
                 enough to determine the constraints for the next step.
                 Additional constraints may cause conflict.
             - For air phase, collocation on torso link and all joints.
             - TODO(yetong): For single leg contact, collocation on all joints
+            Any scheme other than Euler is treated as Trapezoidal.
         """
         graph = NonlinearFactorGraph()
-        collocation = gtd.CollocationScheme.Trapezoidal
         for time_step in range(len(step_phases)):
             phase = step_phases[time_step]
             k_prev = time_step
@@ -121,17 +122,28 @@ class RobotGraphBuilder:
             twistaccel_curr_key = gtd.TwistAccelKey(i, k_curr).key()
 
             pose_col_cost_model = self.graph_builder.opt().pose_col_cost_model
-            graph.add(
-                gtd.TrapezoidalPoseCollocationFactor(pose_prev_key,
-                                                     pose_curr_key,
-                                                     twist_prev_key,
-                                                     twist_curr_key, dt_key,
-                                                     pose_col_cost_model))
             twist_col_cost_model = self.graph_builder.opt(
             ).twist_col_cost_model
-            graph.add(
-                gtd.TrapezoidalPoseCollocationFactor(
-                    twist_prev_key, twist_curr_key, twistaccel_prev_key,
-                    twistaccel_curr_key, dt_key, twist_col_cost_model))
+            if collocation == gtd.CollocationScheme.Euler:
+                graph.add(
+                    gtd.EulerPoseCollocationFactor(pose_prev_key,
+                                                   pose_curr_key,
+                                                   twist_prev_key, dt_key,
+                                                   pose_col_cost_model))
+                graph.add(
+                    gtd.EulerTwistCollocationFactor(twist_prev_key,
+                                                    twist_curr_key,
+                                                    twistaccel_prev_key,
+                                                    dt_key,
+                                                    twist_col_cost_model))
+            else:
+                graph.add(
+                    gtd.TrapezoidalPoseCollocationFactor(
+                        pose_prev_key, pose_curr_key, twist_prev_key,
+                        twist_curr_key, dt_key, pose_col_cost_model))
+                graph.add(
+                    gtd.TrapezoidalTwistCollocationFactor(
+                        twist_prev_key, twist_curr_key, twistaccel_prev_key,
+                        twistaccel_curr_key, dt_key, twist_col_cost_model))
 
         return graph
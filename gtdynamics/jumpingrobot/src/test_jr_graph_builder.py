@@ -59,6 +59,92 @@ class TestJRGraphBuilder(unittest.TestCase):
             self.jr, step_phases)
         self.assertEqual(graph_col.size(), 48)
 
+    def torso_values(self, euler: bool) -> gtsam.Values:
+        """ Create torso values for one step of phase 0, which exactly satisfy
+            Euler collocation if `euler` is true, and trapezoidal collocation
+            otherwise. The twist accelerations differ between the two steps,
+            so the values do not satisfy the other scheme.
+        """
+        i = self.jr.robot.link("torso").id()
+        dt = 0.1
+        pose_prev = gtsam.Pose3(gtsam.Rot3.Rx(0.1), gtsam.Point3(0, 0.1, 0.5))
+        twist_prev = np.array([0.5, 0, 0, 0, 1, 2])
+        accel_prev = np.array([1, 0, 0, 0, -2, 3])
+        accel_curr = np.array([-1, 0, 0, 0, 2, -3])
+        if euler:
+            twist_curr = twist_prev + dt * accel_prev
+            twist_dt = dt * twist_prev
+        else:
+            twist_curr = twist_prev + 0.5 * dt * (accel_prev + accel_curr)
+            twist_dt = 0.5 * dt * (twist_prev + twist_curr)
+        pose_curr = pose_prev.compose(gtsam.Pose3.Expmap(twist_dt))
+
+        values = gtsam.Values()
+        values.insert(gtd.PhaseKey(0).key(), dt)
+        gtd.InsertPose(values, i, 0, pose_prev)
+        gtd.InsertPose(values, i, 1, pose_curr)
+        gtd.InsertTwist(values, i, 0, twist_prev)
+        gtd.InsertTwist(values, i, 1, twist_curr)
+        gtd.InsertTwistAccel(values, i, 0, accel_prev)
+        gtd.InsertTwistAccel(values, i, 1, accel_curr)
+        return values
+
+    def test_torso_trapezoidal_collocation(self):
+        """ Test torso collocation evaluates on pose and twist values. """
+        robot_graph_builder = self.jr_graph_builder.robot_graph_builder
+        graph = robot_graph_builder.collocation_graph(self.jr, [0])
+        values = self.torso_values(euler=False)
+        self.assertAlmostEqual(graph.error(values), 0)
+        self.assertEqual(graph.linearize(values).size(), 2)
+
+    def actuation_values(self) -> gtsam.Values:
+        """ Create actuation values for one step of phase 0, which exactly
+            satisfy Euler but not trapezoidal collocation.
+        """
+        dt = 0.1
+        values = gtsam.Values()
+        values.insert(gtd.PhaseKey(0).key(), dt)
+        m_s = 1e-2
+        for actuator in self.jr.actuators:
+            j = actuator.j
+            m_a, mdot_prev, mdot_curr = 1e-3, 1e-3, 2e-3
+            values.insert(Actuator.MassKey(j, 0), m_a)
+            values.insert(Actuator.MassKey(j, 1), m_a + mdot_prev * dt)
+            values.insert(Actuator.MassRateActualKey(j, 0), mdot_prev)
+            values.insert(Actuator.MassRateActualKey(j, 1), mdot_curr)
+            m_s -= mdot_prev * dt
+        values.insert(Actuator.SourceMassKey(0), 1e-2)
+        values.insert(Actuator.SourceMassKey(1), m_s)
+        return values
+
+    def test_robot_collocation_scheme(self):
+        """ Test the torso collocation follows the chosen scheme. """
+        robot_graph_builder = self.jr_graph_builder.robot_graph_builder
+        euler_graph = robot_graph_builder.collocation_graph(
+            self.jr, [0], gtd.CollocationScheme.Euler)
+        trapezoidal_graph = robot_graph_builder.collocation_graph(
+            self.jr, [0], gtd.CollocationScheme.Trapezoidal)
+        values = self.torso_values(euler=True)
+        self.assertAlmostEqual(euler_graph.error(values), 0)
+        self.assertGreater(trapezoidal_graph.error(values), 1)
+
+    def test_actuation_collocation_scheme(self):
+        """ Test the mass collocation follows the chosen scheme. """
+        actuation_graph_builder = self.jr_graph_builder.actuation_graph_builder
+        euler_graph = actuation_graph_builder.collocation_graph(
+            self.jr, [0], gtd.CollocationScheme.Euler)
+        trapezoidal_graph = actuation_graph_builder.collocation_graph(
+            self.jr, [0], gtd.CollocationScheme.Trapezoidal)
+        values = self.actuation_values()
+        self.assertAlmostEqual(euler_graph.error(values), 0)
+        self.assertGreater(trapezoidal_graph.error(values), 1)
+
+    def test_unsupported_collocation_scheme(self):
+        """ Test schemes without collocation factors are rejected. """
+        with self.assertRaises(Exception):
+            self.jr_graph_builder.collocation_graph(
+                self.jr, [0], gtd.CollocationScheme.RungeKutta)
+
 
 if __name__ == "__main__":
     unittest.main()
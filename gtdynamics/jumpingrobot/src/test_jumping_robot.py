@@ -40,6 +40,24 @@ class TestJumpingRobot(unittest.TestCase):
         self.assertEqual(self.jr.robot.numLinks(), 6)
         self.assertEqual(self.jr.robot.numJoints(), 6)
 
+    def test_load_file(self):
+        """ Test that params are cached, but each robot gets its own copy. """
+        params = JumpingRobot.load_file(self.yaml_file_path)
+        self.assertEqual(params, self.jr.params)
+        self.assertIsNot(params, self.jr.params)
+
+    def test_compute_poses(self):
+        """ Test that poses are cached, but each call gets its own dicts. """
+        length_list = self.jr.params["morphology"]["l"]
+        foot_distance = self.jr.params["morphology"]["foot_dist"]
+        poses_a = JumpingRobot.compute_poses(length_list, foot_distance)
+        poses_b = JumpingRobot.compute_poses(length_list, foot_distance)
+        for dict_a, dict_b in zip(poses_a, poses_b):
+            self.assertIsNot(dict_a, dict_b)
+            self.assertEqual(dict_a.keys(), dict_b.keys())
+            for name in dict_a:
+                self.assertTrue(dict_a[name].equals(dict_b[name], 1e-9))
+
     def test_forward_kinematics(self):
         """ Test forward kinematics of jumping robot. """
         values = gtsam.Values()
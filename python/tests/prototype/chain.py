@@ -9,26 +9,76 @@
  * @author Frank Dellaert
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import gtdynamics as gtd
 import numpy as np
 from gtsam import Pose3
 
+# Jacobian of a chain without any joints.
+_EMPTY_JACOBIAN = np.zeros((6, 0))
+
 
 def compose(aSbj: Tuple[Pose3, np.ndarray], bSck: Tuple[Pose3, np.ndarray]):
     """Monoid operation for chains, i.e., pose,Jacobian pairs."""
-    aTb, bAj = aSbj
-    bTc, cAk = bSck
-    assert bAj.shape[0] == 6 and cAk.shape[0] == 6,\
-        f"Jacobians should have 6 rows, shapes are {bAj.shape} and {cAk.shape}"
-
-    # Compose poses:
-    aTc = aTb.compose(bTc)
-
-    # Adjoint the first Jacobian to the new end-effector frame C:
-    c_Ad_b = bTc.inverse().AdjointMap()
-    return aTc, np.hstack((c_Ad_b @ bAj, cAk))
+    return compose_all([aSbj, bSck])
+
+
+def compose_all(pairs: List[Tuple[Pose3, np.ndarray]]):
+    """Compose a sequence of pose,Jacobian pairs in one backward pass.
+
+    Same result as folding `compose` from the left, but every Jacobian is
+    adjointed to the final frame only once, so linear instead of quadratic.
+    """
+    cTe = Pose3()
+    blocks = []
+    for bTc, cAk in reversed(pairs):
+        assert cAk.shape[0] == 6,\
+            f"Jacobians should have 6 rows, shape is {cAk.shape}"
+        blocks.append(cTe.inverse().AdjointMap() @ cAk)
+        cTe = bTc.compose(cTe)
+    return cTe, np.hstack(blocks[::-1])
+
+
+def skew(w: np.ndarray):
+    """Batch of 3*3 skew-symmetric matrices from ...*3 vectors."""
+    K = np.zeros(w.shape[:-1] + (3, 3))
+    K[..., 0, 1], K[..., 0, 2] = -w[..., 2], w[..., 1]
+    K[..., 1, 0], K[..., 1, 2] = w[..., 2], -w[..., 0]
+    K[..., 2, 0], K[..., 2, 1] = -w[..., 1], w[..., 0]
+    return K
+
+
+def rodrigues(theta2: np.ndarray, K: np.ndarray, K2: np.ndarray,
+              v: np.ndarray):
+    """Batch SE(3) exponentials from precomputed Rodrigues ingredients.
+
+    Arguments:
+        theta2: squared rotation angles |w|^2, with any batch shape (...).
+        K, K2: ...*3*3 matrices skew(w) and skew(w)^2.
+        v: ...*3 translational parts of the twists.
+    Returns:
+        ...*4*4 homogeneous transforms.
+    """
+    theta = np.sqrt(theta2)
+
+    # Rodrigues coefficients, with Taylor expansions close to zero rotation.
+    small = theta2 < 1e-8
+    safe = np.where(small, 1.0, theta)
+    a = np.where(small, 1 - theta2 / 6, np.sin(safe) / safe)
+    b = np.where(small, 0.5 - theta2 / 24, (1 - np.cos(safe)) / safe**2)
+    c = np.where(small, 1 / 6 - theta2 / 120,
+                 (safe - np.sin(safe)) / safe**3)
+
+    I = np.eye(3)
+    R = I + a[..., None, None] * K + b[..., None, None] * K2
+    V = I + b[..., None, None] * K + c[..., None, None] * K2
+
+    T = np.zeros(theta2.shape + (4, 4))
+    T[..., :3, :3] = R
+    T[..., :3, 3] = np.einsum('...ij,...j->...i', V, v)
+    T[..., 3, 3] = 1
+    return T
 
 
 class Chain():
@@ -46,13 +96,25 @@ class Chain():
         self.sMb = sMb
         self.axes = np.expand_dims(axes, 1) if len(axes.shape) == 1 else axes
 
+        # Slice the axes into 6*1 columns once, rather than in every poe call.
+        self._columns = [self.axes[:, j:j + 1]
+                         for j in range(self.axes.shape[1])]
+
+        # Also pack them as contiguous n*6 rows, as used by the batch methods.
+        self._screws = np.ascontiguousarray(self.axes.T, dtype=float)
+
+        # The axes are fixed, so precompute what Rodrigues' formula needs: for
+        # exp(A_j q_j) only skew(w_j) and skew(w_j)^2 get scaled by q_j, q_j^2.
+        w = self._screws[:, :3]
+        self._w2 = np.sum(w * w, axis=1)
+        self._K = skew(w)
+        self._K2 = self._K @ self._K
+
     @classmethod
     def compose(cls, *components):
         """Create from a variable number of other Chain instances."""
-        spec = components[0].spec()
-        for component in components[1:]:
-            spec = compose(spec, component.spec())
-        return cls(*spec)
+        specs = [component.spec() for component in components]
+        return cls(*compose_all(specs))
 
     def spec(self):
         """Return end-effector at rest and Jacobian."""
@@ -86,7 +148,7 @@ class Chain():
                 "Cannot have base name if first joint is not 0"
             base_link = robot.link(base_name)
             sM0 = base_link.bMcom()
-            offset = Chain(sM0, np.zeros((6, 0)))
+            offset = Chain(sM0, _EMPTY_JACOBIAN)
             pairs = [offset] + pairs
 
         # Now, let compose do the work!
@@ -104,28 +166,72 @@ class Chain():
         Returns:
             jTe (Pose3)
         """
-        # Check input.
-        n = len(q)
-        A = self.axes
-        assert n == A.shape[1]
-
-        # Calculate exponentials.
-        exp = [Pose3.Expmap(A[:, j] * q[j]) for j in range(n)]
-
         if J is None:
-            # Just do product.
-            poe = self.sMb
-            for T_j in exp:
-                poe = poe.compose(T_j)
-            return poe if fTe is None else poe.compose(fTe)
+            # Just do product, in numpy.
+            return Pose3(self.poe_matrix(q, fTe))
         else:
             # Compute FK + Jacobian with monoid compose.
             assert J.shape == (6, len(q)), f"Needs 6x{len(q)} J."
-            Empty = np.zeros((6, 0))
-            pair = self.sMb, Empty
-            for j in range(n):
-                pair = compose(pair, (exp[j], np.expand_dims(A[:, j], 1)))
+            exp = self.exponentials(q)
+            pairs = [(self.sMb, _EMPTY_JACOBIAN)]
+            pairs += zip(map(Pose3, exp), self._columns)
             if fTe is not None:
-                pair = compose(pair, (fTe, Empty))  # Adjoints Jacobian to E!
-            poe, J[:, :] = pair
+                # Adjoints Jacobian to E!
+                pairs.append((fTe, _EMPTY_JACOBIAN))
+            poe, J[:, :] = compose_all(pairs)
             return poe
+
+    def exponentials(self, q: np.ndarray):
+        """ Calculate the exponentials of all joints in a single batch.
+
+        Arguments:
+            q (np.ndarray): joint angles for all joints.
+        Returns:
+            n*4*4 joint transforms exp(A_j q_j), as homogeneous matrices.
+        """
+        q = np.asarray(q, dtype=float)
+        assert len(q) == len(self._screws)
+        q2 = q * q
+        return rodrigues(q2 * self._w2, q[:, None, None] * self._K,
+                         q2[:, None, None] * self._K2,
+                         q[:, None] * self._screws[:, 3:])
+
+    def poe_matrix(self, q: np.ndarray, fTe: Optional[Pose3] = None):
+        """ Perform forward kinematics given q, without creating Pose3 objects.
+
+        Arguments:
+            q (np.ndarray): joint angles for all joints.
+            fTe (optional): the end-effector pose with respect to final link.
+        Returns:
+            4*4 end-effector pose, as a homogeneous matrix.
+        """
+        poe = self.sMb.matrix()
+        for T_j in self.exponentials(q):
+            poe = poe @ T_j
+        return poe if fTe is None else poe @ fTe.matrix()
+
+    def poe_batch(self, qs: np.ndarray, fTe: Optional[Pose3] = None):
+        """ Perform forward kinematics for a batch of joint configurations.
+
+        Arguments:
+            qs (np.ndarray): N*n joint angles, one configuration per row.
+            fTe (optional): the end-effector pose with respect to final link.
+        Returns:
+            N*4*4 end-effector poses, as homogeneous matrices.
+        """
+        qs = np.atleast_2d(qs)
+        N, n = qs.shape
+        assert n == len(self._screws)
+
+        # Calculate the exponentials of all joints in all configurations,
+        # broadcasting the precomputed axis terms over the batch.
+        qs2 = qs * qs
+        exp = rodrigues(qs2 * self._w2, qs[..., None, None] * self._K,
+                        qs2[..., None, None] * self._K2,
+                        qs[..., None] * self._screws[:, 3:])
+
+        # Product over joints, vectorized over configurations.
+        poe = np.broadcast_to(self.sMb.matrix(), (N, 4, 4))
+        for j in range(n):
+            poe = poe @ exp[:, j]
+        return poe if fTe is None else poe @ fTe.matrix()
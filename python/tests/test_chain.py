@@ -10,6 +10,7 @@
 """
 
 import unittest
+from functools import reduce
 from pathlib import Path
 
 import gtdynamics as gtd
@@ -17,7 +18,7 @@ import numpy as np
 from gtsam import Point3, Pose3, Rot3, Values
 from gtsam.utils.test_case import GtsamTestCase
 
-from prototype.chain import Chain
+from prototype.chain import Chain, compose, compose_all
 
 
 def axis(*A):
@@ -46,6 +47,17 @@ class TestChain(GtsamTestCase):
         self.gtsamAssertEquals(joint1.poe(q, J=J), sTb)
         np.testing.assert_allclose(J, Jb)
 
+    def test_exponentials(self):
+        """Test batch exponentials agree with Pose3.Expmap."""
+        sMb, Jb = Pose3(Rot3(), Point3(5, 0, 0)), axis(0, 0, 1, 0, 5, 0)
+        three_links = Chain.compose(*[Chain(sMb, Jb)] * 3)
+        q = np.array([0.1, 0, -np.pi / 2])
+        exp = three_links.exponentials(q)
+        self.assertEqual(exp.shape, (3, 4, 4))
+        for j in range(3):
+            expected = Pose3.Expmap(three_links.axes[:, j] * q[j])
+            self.gtsamAssertEquals(Pose3(exp[j]), expected, tol=1e-9)
+
     def test_three_link(self):
         """Test creating a two-link arm in SE(2)."""
         sMb, Jb = Pose3(Rot3(), Point3(5, 0, 0)), axis(0, 0, 1, 0, 5, 0)
@@ -198,6 +210,43 @@ class TestPanda(GtsamTestCase):
         fTe = Pose3(Rot3.Ry(0.1), Point3(1, 2, 3))
         self.check_poe([0.1, -0.2, 0.3, -0.4, 0.5, -0.6, 0.7], fTe)
 
+    def test_compose_all(self):
+        """Test single-pass composition agrees with folding compose."""
+        fTe = Pose3(Rot3.Ry(0.1), Point3(1, 2, 3))
+        q = np.array([0.1, -0.2, 0.3, -0.4, 0.5, -0.6, 0.7])
+        pairs = [(self.chain.sMb, np.zeros((6, 0)))]
+        pairs += [(Pose3.Expmap(self.chain.axes[:, j] * q[j]),
+                   self.chain.axes[:, j:j + 1]) for j in range(7)]
+        pairs.append((fTe, np.zeros((6, 0))))
+        expected_pose, expected_J = reduce(compose, pairs)
+        pose, J = compose_all(pairs)
+        self.gtsamAssertEquals(pose, expected_pose)
+        np.testing.assert_allclose(J, expected_J, atol=1e-9)
+
+    def test_poe_matrix(self):
+        """Test numpy FK agrees with composing the joint exponentials."""
+        fTe = Pose3(Rot3.Ry(0.1), Point3(1, 2, 3))
+        q = np.array([0.1, -0.2, 0.3, -0.4, 0.5, -0.6, 0.7])
+        expected = self.chain.sMb
+        for j in range(7):
+            expected = expected.compose(
+                Pose3.Expmap(self.chain.axes[:, j] * q[j]))
+        self.gtsamAssertEquals(Pose3(self.chain.poe_matrix(q)), expected)
+        self.gtsamAssertEquals(Pose3(self.chain.poe_matrix(q, fTe)),
+                               expected.compose(fTe))
+
+    def test_poe_batch(self):
+        """Test batch FK agrees with POE for every configuration."""
+        fTe = Pose3(Rot3.Ry(0.1), Point3(1, 2, 3))
+        qs = np.array([[0, 0, 0, 0, 0, 0, 0],
+                       [np.pi / 2, 0, 0, 0, 0, 0, 0],
+                       [0.1, -0.2, 0.3, -0.4, 0.5, -0.6, 0.7]])
+        poses = self.chain.poe_batch(qs, fTe=fTe)
+        self.assertEqual(poses.shape, (3, 4, 4))
+        for q, pose in zip(qs, poses):
+            self.gtsamAssertEquals(Pose3(pose), self.chain.poe(q, fTe=fTe),
+                                   tol=1e-9)
+
     def test_panda_decomposition(self):
         """Test composition of Panda as shoulder and arm"""
         # Construct Panda arm with compose